@@ -39,15 +39,16 @@ def move_motor_degrees(motor: Motor, degrees: float):
     if step_count < 0:
         gpio.set_pin(motor.settings.direction_pin, False)
         step_count = -step_count
+    # loop invariants of the acceleration profile, computed once per move
+    inv_acc = 1 / acc
+    half_steps = step_count / 2
     for x in range(step_count):
         gpio.set_pin(motor.settings.step_pin, True)
-        if x <= ramp and x <= step_count / 2:
+        if x <= ramp and x <= half_steps:
+            delay = delay_init * (1 - inv_acc * math.cos((ramp - x) / ramp) + inv_acc)
+        elif step_count - x <= ramp and x > half_steps:
             delay = delay_init * (
-                1 + -1 / acc * math.cos(1 * (ramp - x) / ramp) + 1 / acc
-            )
-        elif step_count - x <= ramp and x > step_count / 2:
-            delay = delay_init * (
-                1 - 1 / acc * math.cos(1 * (ramp + x - step_count) / ramp) + 1 / acc
+                1 - inv_acc * math.cos((ramp + x - step_count) / ramp) + inv_acc
             )
         else:
             delay = delay_init
@@ -18,13 +18,15 @@ from app.config import config
 ALLOWED_EXTENSIONS = (".jpg", ".jpeg", ".png")
 
 def get_projects() -> list[Project]:
-    return [
-        get_project(folder)
-        for folder in os.listdir(config.projects_path)
-        if os.path.exists(
-            config.projects_path.joinpath(folder, "openscan_project.json")
-        )
-    ]
+    # scandir's cached d_type lets us skip plain files without an extra stat
+    with os.scandir(config.projects_path) as entries:
+        folders = [
+            entry.name
+            for entry in entries
+            if entry.is_dir()
+            and os.path.exists(os.path.join(entry.path, "openscan_project.json"))
+        ]
+    return [get_project(folder) for folder in folders]
 
 def _get_project_path(project_name: str) -> pathlib.Path:
     return config.projects_path.joinpath(project_name)
@@ -36,23 +38,31 @@ def _get_project_photos(project_path: pathlib.Path) -> list[str]:
 def get_project(project_name: str) -> Project:
     project_path = _get_project_path(project_name)
     photos = _get_project_photos(project_path)
-    with open(project_path.joinpath("openscan_project.json")) as f:
+    with open(project_path.joinpath("openscan_project.json"), "rb") as f:
         return Project(name=project_name, path=project_path, photos=photos, **orjson.loads(f.read()))
 
 
 def delete_project(project: Project) -> bool:
     shutil.rmtree(project.path)
 
+def _write_file_atomic(path: pathlib.Path, data: bytes):
+    # write next to the target and rename over it, so a crash never leaves a torn file
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
 def save_project(project: Project):
     os.makedirs(project.path, exist_ok=True)
-    with open(project.path.joinpath("openscan_project.json"), "wb") as f:
-        f.write(orjson.dumps({"created": project.created, "uploaded": project.uploaded}))
+    _write_file_atomic(
+        project.path.joinpath("openscan_project.json"),
+        orjson.dumps({"created": project.created, "uploaded": project.uploaded}),
+    )
 
 def new_project(project_name: str) -> Project:
-    projects = get_projects()
-    if project_name in [project.name for project in projects]:
-        raise ValueError(f"Project {project_name} already exists")
     project_path = _get_project_path(project_name)
+    if os.path.exists(project_path.joinpath("openscan_project.json")):
+        raise ValueError(f"Project {project_name} already exists")
     project = Project(name=project_name, path=project_path, created=datetime.now())
     save_project(project)
     return project
@@ -38,8 +38,8 @@ def scan(project: Project, camera: Camera, path: list[CartesianPoint3D]):
     
     total = len(path)
     index = 0
+    camera_controller = cameras.get_camera_controller(camera)
     for point in path:
-        camera_controller = cameras.get_camera_controller(camera)
         photo = camera_controller.photo(camera)
         move_to_point(paths.cartesian_to_polar(point))
         time.sleep(0.2)
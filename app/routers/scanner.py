@@ -40,7 +40,7 @@ async def scan(
     async def generate():
         for i,t in scanner.scan(project, camera, path):
             yield b'event: status\ndata: {"step":"%s","total":"%s"}\n\n' % (bytes(str(i),'UTF-8'),bytes(str(t),'UTF-8'),)
-            await asyncio.sleep(0.03)
+            await asyncio.sleep(0)
     
     return StreamingResponse(generate(), media_type="text/event-stream")
 